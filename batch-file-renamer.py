@@ -40,6 +40,9 @@ Example transformations:
     Process subdirectories recursively:
         python3 batch-file-renamer.py /path/to/folder --recursive --apply
 
+    Show summaries only (useful for very large folders):
+        python3 batch-file-renamer.py /path/to/folder --recursive --quiet
+
     Combined example:
         python3 batch-file-renamer.py /path/to/folder --replace=- --prefix="2024_" --apply
 
@@ -60,8 +63,15 @@ Example transformations:
 """
 
 import os
+import re
 import sys
 import argparse
+import ctypes
+import errno
+import io
+import itertools
+import platform
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 
 
@@ -71,6 +81,38 @@ from datetime import datetime
 MAX_FILES_LIMIT = 10000  # Upper bound for safety (NASA Principle #2)
 LOG_FILENAME_PREFIX = "rename_log_"
 DEFAULT_REPLACEMENT = "_"
+SCAN_WORKERS = 8  # Threads listing directories during recursive scans
+RENAME_WORKERS = 16  # Threads renaming files (one directory per thread at a time)
+OUTPUT_CHUNK_SIZE = 256  # Per-file console lines buffered before each write
+
+# Characters not allowed in filenames (cross-platform safety)
+INVALID_FILENAME_CHARS_RE = re.compile(r'[/\\:*?"<>|\x00]')
+
+# Renames relative to an open directory handle (POSIX only, not Windows)
+RENAME_DIR_FD_SUPPORTED = (os.rename in os.supports_dir_fd
+                           and os.stat in os.supports_dir_fd
+                           and os.link in os.supports_dir_fd
+                           and os.unlink in os.supports_dir_fd
+                           and hasattr(os, 'O_DIRECTORY'))
+
+# No-clobber renames via hard links (POSIX). link() must not follow
+# symlinks, otherwise a symlink would be replaced by a link to its target.
+LINK_NOREPLACE_SUPPORTED = os.name != 'nt' and os.link in os.supports_follow_symlinks
+
+# link() errors meaning the filesystem cannot hard-link this file
+NO_HARD_LINK_ERRNOS = frozenset(
+    getattr(errno, name) for name in
+    ('EPERM', 'EXDEV', 'EMLINK', 'ENOTSUP', 'EOPNOTSUPP', 'ENOSYS')
+    if hasattr(errno, name)
+)
+
+# Linux renameat2() arguments for atomic no-clobber renames
+AT_FDCWD = -100
+RENAME_NOREPLACE = 1
+RENAMEAT2_SYSCALL_NUMBERS = {'x86_64': 316, 'aarch64': 276}
+
+# renameat2() errors meaning the kernel or filesystem lacks support
+RENAMEAT2_UNSUPPORTED_ERRNOS = frozenset((errno.EINVAL, errno.ENOSYS))
 
 
 # ------------------------------------------------------------------------------
@@ -102,12 +144,9 @@ def validate_replacement_char(replacement):
     @param replacement: The replacement string to validate
     @return: Tuple (is_valid: bool, error_message: str or None)
     """
-    # Characters not allowed in filenames (cross-platform safety)
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0']
-
-    for char in replacement:
-        if char in invalid_chars:
-            return False, f"Invalid character in replacement: '{char}'"
+    match = INVALID_FILENAME_CHARS_RE.search(replacement)
+    if match:
+        return False, f"Invalid character in replacement: '{match.group(0)}'"
 
     # Reasonable length limit
     if len(replacement) > 10:
@@ -127,12 +166,9 @@ def validate_prefix_suffix(value, label):
     if not value:
         return True, None
 
-    # Characters not allowed in filenames (cross-platform safety)
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '\0']
-
-    for char in value:
-        if char in invalid_chars:
-            return False, f"Invalid character in {label}: '{char}'"
+    match = INVALID_FILENAME_CHARS_RE.search(value)
+    if match:
+        return False, f"Invalid character in {label}: '{match.group(0)}'"
 
     # Reasonable length limit
     if len(value) > 100:
@@ -141,11 +177,24 @@ def validate_prefix_suffix(value, label):
     return True, None
 
 
+def build_translation_table(replacement="_"):
+    """
+    Builds the str.translate table that replaces dots and spaces.
+
+    @param replacement: Character(s) to replace dots and spaces with (default: "_")
+    @return: Translation table for str.translate
+    """
+    return str.maketrans({'.': replacement, ' ': replacement})
+
+
 def generate_new_filename(original_filename, replacement="_", prefix="", suffix=""):
     """
     Generates a new filename by replacing internal dots and spaces.
     Optionally adds prefix and/or suffix to the base filename.
 
+    Convenience wrapper for a single name; scans build the transform once
+    with _make_rename_fn instead.
+
     @param original_filename: The original filename to process
     @param replacement: Character(s) to replace dots and spaces with (default: "_")
     @param prefix: String to add before the filename (default: "")
@@ -164,46 +213,190 @@ def generate_new_filename(original_filename, replacement="_", prefix="", suffix=
     assert isinstance(original_filename, str), "Filename must be a string"
     assert len(original_filename) > 0, "Filename cannot be empty"
 
-    # Skip hidden files (start with dot)
-    if original_filename.startswith('.'):
-        return original_filename, False
+    new_filename = _make_rename_fn(replacement, prefix, suffix)(original_filename)
+    return new_filename, new_filename is not original_filename
 
-    # Find the last dot (the real extension separator)
-    last_dot_index = original_filename.rfind('.')
 
-    # Handle files with no extension
-    if last_dot_index == -1:
-        base_name = original_filename
-        extension = ""
-    else:
-        base_name = original_filename[:last_dot_index]
-        extension = original_filename[last_dot_index:]  # Includes the dot
+def _make_rename_fn(replacement="_", prefix="", suffix=""):
+    """
+    Builds a filename transform specialized for one run's settings.
 
-    # Count characters that need replacement
-    dots_count = base_name.count('.')
-    spaces_count = base_name.count(' ')
-    needs_char_replacement = (dots_count > 0) or (spaces_count > 0)
-    needs_prefix_suffix = bool(prefix) or bool(suffix)
+    Only internal dots and spaces are replaced: the last dot (extension
+    separator) is kept and hidden files are left alone. The translation
+    table and the prefix/suffix decision are fixed up front, so the
+    per-file call takes a single argument and skips branches that cannot
+    apply.
 
-    # If nothing to change, return original
-    if not needs_char_replacement and not needs_prefix_suffix:
-        return original_filename, False
+    @param replacement: Character(s) to replace dots and spaces with
+    @param prefix: String to add before filenames
+    @param suffix: String to add after filenames (before extension)
+    @return: Function taking a filename and returning the new filename;
+             the same object is returned when the name does not change
+    """
+    table = build_translation_table(replacement)
+
+    def replace_chars(filename):
+        if filename.startswith('.'):
+            return filename
+
+        last_dot_index = filename.rfind('.')
+        base_end = len(filename) if last_dot_index == -1 else last_dot_index
+
+        # Most names need no change: check without slicing first
+        if filename.find('.', 0, base_end) == -1 and filename.find(' ', 0, base_end) == -1:
+            return filename
+
+        new_filename = filename[:base_end].translate(table) + filename[base_end:]
+        return filename if new_filename == filename else new_filename
+
+    def replace_chars_and_add_affixes(filename):
+        if filename.startswith('.'):
+            return filename
+
+        last_dot_index = filename.rfind('.')
+        base_end = len(filename) if last_dot_index == -1 else last_dot_index
+        base_name = filename[:base_end]
+
+        if '.' in base_name or ' ' in base_name:
+            base_name = base_name.translate(table)
+
+        new_filename = prefix + base_name + suffix + filename[base_end:]
+        return filename if new_filename == filename else new_filename
 
-    # Replace dots and spaces in base name
-    new_base_name = base_name
-    if needs_char_replacement:
-        new_base_name = new_base_name.replace('.', replacement)
-        new_base_name = new_base_name.replace(' ', replacement)
+    if prefix or suffix:
+        return replace_chars_and_add_affixes
+    return replace_chars
 
-    # Apply prefix and suffix
-    new_base_name = prefix + new_base_name + suffix
 
-    # Reconstruct filename
-    new_filename = new_base_name + extension
+# Cache markers for _memoize_rename_fn (distinct from any string result)
+_UNCHANGED = object()
+_MISSING = object()
 
-    was_changed = (new_filename != original_filename)
 
-    return new_filename, was_changed
+def _memoize_rename_fn(rename_fn):
+    """
+    Wraps a transform from _make_rename_fn with a per-scan result cache.
+
+    Recursive scans often see the same filename in many directories
+    (README.md, __init__.py, ...), so repeats become a dictionary lookup.
+    The wrapper keeps the identity contract: unchanged names are returned
+    as the same object that was passed in. The cache is bounded by
+    MAX_FILES_LIMIT since it lives only for one scan.
+
+    @param rename_fn: Function returned by _make_rename_fn
+    @return: Function with the same behaviour as rename_fn
+    """
+    cache = {}
+
+    def cached_rename(filename):
+        new_filename = cache.get(filename, _MISSING)
+        if new_filename is _MISSING:
+            new_filename = rename_fn(filename)
+            cache[filename] = _UNCHANGED if new_filename is filename else new_filename
+            return new_filename
+        if new_filename is _UNCHANGED:
+            return filename
+        return new_filename
+
+    return cached_rename
+
+
+def _scan_directory(directory_path):
+    """
+    Lists a single directory, separating files from subdirectories.
+
+    Hidden directories are counted but not returned, and symlinked
+    directories are not followed (matching os.walk defaults).
+
+    @param directory_path: Path to the directory to list
+    @return: Tuple (files: list of os.DirEntry, subdirs: list of str,
+             hidden_dirs: int), or None if the directory cannot be read
+    """
+    files = []
+    subdirs = []
+    hidden_dirs = 0
+
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name.startswith('.'):
+                        hidden_dirs += 1
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+
+                files.append(entry)
+    except OSError:
+        return None
+
+    return files, subdirs, hidden_dirs
+
+
+def _walk_scandir(directory_path, stats):
+    """
+    Recursively yields the non-directory entries below a directory.
+
+    Directory listings are fetched concurrently by a thread pool, since
+    they are latency bound (especially on network filesystems) and scandir
+    releases the GIL. Results are then yielded in the same order as a
+    serial walk: files of a directory before those of its subdirectories.
+    Unreadable directories are ignored (matching os.walk defaults).
+
+    @param directory_path: Path to the directory to walk
+    @param stats: Dictionary with scan statistics (updated in place)
+    @return: Generator of os.DirEntry objects for files
+    """
+    results = {}
+
+    # Depth-first walk over the directories listed so far. It advances only
+    # through completed listings, so prefix_files counts exactly the files a
+    # serial walk would have reached at that point.
+    prefix_stack = [directory_path]
+    prefix_files = 0
+
+    # Fan out one listing task per directory. Results are merged on this
+    # thread only, so no locking is needed. Once the depth-first prefix
+    # exceeds the file limit, every unlisted directory comes after the
+    # cutoff, so no further listings are submitted; the caller reports the
+    # limit while consuming.
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        pending = {executor.submit(_scan_directory, directory_path): directory_path}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                path = pending.pop(future)
+                result = future.result()
+                results[path] = result  # None if the directory is unreadable
+
+                if result is None or prefix_files > MAX_FILES_LIMIT:
+                    continue
+
+                for subdir in result[1]:
+                    pending[executor.submit(_scan_directory, subdir)] = subdir
+
+            while prefix_stack and prefix_stack[-1] in results:
+                result = results[prefix_stack.pop()]
+                if result is not None:
+                    prefix_files += len(result[0])
+                    prefix_stack.extend(reversed(result[1]))
+
+    # Yield in depth-first order
+    stack = [directory_path]
+    while stack:
+        result = results.get(stack.pop())
+        if result is None:
+            continue
+
+        files, subdirs, hidden_dirs = result
+        stats['directories_scanned'] += 1
+        stats['hidden_dirs_skipped'] += hidden_dirs
+
+        yield from files
+
+        stack.extend(reversed(subdirs))
 
 
 def collect_files_to_rename(directory_path, replacement="_", prefix="", suffix="",
@@ -221,6 +414,7 @@ def collect_files_to_rename(directory_path, replacement="_", prefix="", suffix="
              stats: Dictionary with scan statistics
     """
     files_to_rename = []
+    rename_fn = _make_rename_fn(replacement, prefix, suffix)
     stats = {
         'total_files_scanned': 0,
         'hidden_files_skipped': 0,
@@ -231,57 +425,12 @@ def collect_files_to_rename(directory_path, replacement="_", prefix="", suffix="
     }
 
     if recursive:
-        # Walk through directory tree
-        for root, dirs, files in os.walk(directory_path):
-            stats['directories_scanned'] += 1
-
-            # Count and skip hidden directories
-            hidden_dirs = [d for d in dirs if d.startswith('.')]
-            stats['hidden_dirs_skipped'] += len(hidden_dirs)
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-
-            for filename in files:
-                stats['total_files_scanned'] += 1
-
-                if stats['total_files_scanned'] > MAX_FILES_LIMIT:
-                    print(f"Warning: Exceeded {MAX_FILES_LIMIT} files. Stopping scan.")
-                    return files_to_rename, stats
-
-                # Count hidden files
-                if filename.startswith('.'):
-                    stats['hidden_files_skipped'] += 1
-                    continue
-
-                new_filename, was_changed = generate_new_filename(
-                    filename, replacement, prefix, suffix
-                )
-
-                if was_changed:
-                    original_path = os.path.join(root, filename)
-                    new_path = os.path.join(root, new_filename)
-                    files_to_rename.append((original_path, new_path, filename, new_filename))
-                    stats['files_to_rename'] += 1
-                else:
-                    stats['files_already_clean'] += 1
-    else:
-        stats['directories_scanned'] = 1
-
-        # Only process files in the specified directory (not subdirectories)
-        try:
-            entries = os.listdir(directory_path)
-        except PermissionError:
-            print(f"Error: Permission denied to read directory: {directory_path}")
-            return files_to_rename, stats
-
-        for filename in entries:
-            filepath = os.path.join(directory_path, filename)
-
-            # Skip directories (count hidden ones)
-            if os.path.isdir(filepath):
-                if filename.startswith('.'):
-                    stats['hidden_dirs_skipped'] += 1
-                continue
+        # Names only repeat across directories, so cache only here
+        rename_fn = _memoize_rename_fn(rename_fn)
 
+        # Walk through directory tree
+        for entry in _walk_scandir(directory_path, stats):
+            filename = entry.name
             stats['total_files_scanned'] += 1
 
             if stats['total_files_scanned'] > MAX_FILES_LIMIT:
@@ -293,74 +442,292 @@ def collect_files_to_rename(directory_path, replacement="_", prefix="", suffix="
                 stats['hidden_files_skipped'] += 1
                 continue
 
-            new_filename, was_changed = generate_new_filename(
-                filename, replacement, prefix, suffix
-            )
+            new_filename = rename_fn(filename)
 
-            if was_changed:
-                new_path = os.path.join(directory_path, new_filename)
-                files_to_rename.append((filepath, new_path, filename, new_filename))
+            if new_filename is not filename:
+                # entry.path is the parent path + separator + name, so swap
+                # the name in place instead of calling os.path.join
+                new_path = entry.path[:-len(filename)] + new_filename
+                files_to_rename.append((entry.path, new_path, filename, new_filename))
                 stats['files_to_rename'] += 1
             else:
                 stats['files_already_clean'] += 1
+    else:
+        stats['directories_scanned'] = 1
+
+        # Only process files in the specified directory (not subdirectories)
+        # os.scandir serves the directory check from the readdir results,
+        # avoiding a separate stat call per entry
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    filename = entry.name
+
+                    # Skip directories (count hidden ones)
+                    if entry.is_dir():
+                        if filename.startswith('.'):
+                            stats['hidden_dirs_skipped'] += 1
+                        continue
+
+                    stats['total_files_scanned'] += 1
+
+                    if stats['total_files_scanned'] > MAX_FILES_LIMIT:
+                        print(f"Warning: Exceeded {MAX_FILES_LIMIT} files. Stopping scan.")
+                        return files_to_rename, stats
+
+                    # Count hidden files
+                    if filename.startswith('.'):
+                        stats['hidden_files_skipped'] += 1
+                        continue
+
+                    new_filename = rename_fn(filename)
+
+                    if new_filename is not filename:
+                        new_path = entry.path[:-len(filename)] + new_filename
+                        files_to_rename.append((entry.path, new_path, filename, new_filename))
+                        stats['files_to_rename'] += 1
+                    else:
+                        stats['files_already_clean'] += 1
+        except PermissionError:
+            print(f"Error: Permission denied to read directory: {directory_path}")
 
     return files_to_rename, stats
 
 
-def display_preview(files_to_rename, stats, replacement, prefix, suffix):
+def _write_lines(lines):
+    """
+    Writes buffered console lines to stdout in one call and clears the buffer.
+
+    @param lines: List of lines (without trailing newlines); emptied in place
+    @return: None
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def display_preview(files_to_rename, stats, replacement, prefix, suffix, quiet=False):
     """
     Displays a preview of all files that will be renamed.
 
+    The whole preview is assembled in memory and written to stdout in a
+    single call, rather than several small writes per file.
+
     @param files_to_rename: List of file tuples to display
     @param stats: Dictionary with scan statistics
     @param replacement: The replacement character being used
     @param prefix: The prefix being added
     @param suffix: The suffix being added
+    @param quiet: If True, omit the per-file listing and show totals only
     @return: None
     """
+    buf = io.StringIO()
+
     # Display scan summary first
-    print("\n" + "-" * 70)
-    print("SCAN SUMMARY")
-    print("-" * 70)
-    print(f"  Directories scanned:    {stats['directories_scanned']}")
-    print(f"  Total files scanned:    {stats['total_files_scanned']}")
-    print(f"  Hidden files skipped:   {stats['hidden_files_skipped']}")
-    print(f"  Hidden folders skipped: {stats['hidden_dirs_skipped']}")
-    print(f"  Files already clean:    {stats['files_already_clean']}")
-    print(f"  Files to rename:        {stats['files_to_rename']}")
-    print("-" * 70)
+    print("\n" + "-" * 70, file=buf)
+    print("SCAN SUMMARY", file=buf)
+    print("-" * 70, file=buf)
+    print(f"  Directories scanned:    {stats['directories_scanned']}", file=buf)
+    print(f"  Total files scanned:    {stats['total_files_scanned']}", file=buf)
+    print(f"  Hidden files skipped:   {stats['hidden_files_skipped']}", file=buf)
+    print(f"  Hidden folders skipped: {stats['hidden_dirs_skipped']}", file=buf)
+    print(f"  Files already clean:    {stats['files_already_clean']}", file=buf)
+    print(f"  Files to rename:        {stats['files_to_rename']}", file=buf)
+    print("-" * 70, file=buf)
 
     if not files_to_rename:
-        print("\nNo files need renaming in this directory.")
+        print("\nNo files need renaming in this directory.", file=buf)
+        sys.stdout.write(buf.getvalue())
         return
 
-    print("\n" + "=" * 70)
-    print("PREVIEW OF CHANGES (No files have been modified yet)")
-    print("=" * 70)
+    print("\n" + "=" * 70, file=buf)
+    print("PREVIEW OF CHANGES (No files have been modified yet)", file=buf)
+    print("=" * 70, file=buf)
 
     # Show current settings
     replace_display = f"'{replacement}'" if replacement else "(remove)"
-    print(f"\nSettings:")
-    print(f"  Replace dots/spaces with: {replace_display}")
+    print(f"\nSettings:", file=buf)
+    print(f"  Replace dots/spaces with: {replace_display}", file=buf)
     if prefix:
-        print(f"  Add prefix: '{prefix}'")
+        print(f"  Add prefix: '{prefix}'", file=buf)
     if suffix:
-        print(f"  Add suffix: '{suffix}'")
+        print(f"  Add suffix: '{suffix}'", file=buf)
 
-    print("\nFiles to rename:")
-    for i, (orig_path, new_path, orig_name, new_name) in enumerate(files_to_rename, 1):
-        # Show relative directory if different from base
-        directory = os.path.dirname(orig_path)
-        print(f"\n[{i}] Directory: {directory}")
-        print(f"    BEFORE: {orig_name}")
-        print(f"    AFTER:  {new_name}")
+    if not quiet:
+        print("\nFiles to rename:", file=buf)
+        for i, (orig_path, new_path, orig_name, new_name) in enumerate(files_to_rename, 1):
+            # Show relative directory if different from base
+            directory = os.path.dirname(orig_path)
+            buf.write(f"\n[{i}] Directory: {directory}\n"
+                      f"    BEFORE: {orig_name}\n"
+                      f"    AFTER:  {new_name}\n")
 
-    print("\n" + "=" * 70)
-    print(f"Total files to rename: {len(files_to_rename)}")
-    print("=" * 70)
+    print("\n" + "=" * 70, file=buf)
+    print(f"Total files to rename: {len(files_to_rename)}", file=buf)
+    print("=" * 70, file=buf)
+
+    sys.stdout.write(buf.getvalue())
+
+
+def _path_exists(path, dir_fd=None):
+    """
+    Checks whether a path exists, optionally relative to a directory handle.
 
+    @param path: Path (or name relative to dir_fd) to check
+    @param dir_fd: Open directory file descriptor, or None for a plain path
+    @return: True if the path exists (following symlinks), False otherwise
+    """
+    try:
+        os.stat(path, dir_fd=dir_fd)
+    except (OSError, ValueError):
+        return False
+    return True
 
-def apply_renames(files_to_rename, directory_path, replacement, prefix, suffix):
+
+def _load_renameat2():
+    """
+    Looks up Linux renameat2() through ctypes.
+
+    Uses the libc wrapper when present (glibc 2.28+), otherwise the raw
+    system call on architectures with a known syscall number.
+
+    @return: Function (src_dir_fd, src: bytes, dst_dir_fd, dst: bytes, flags)
+             returning 0 on success or -1 with ctypes errno set, or None
+             if unavailable
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+    func = getattr(libc, 'renameat2', None)
+    if func is not None:
+        func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p,
+                         ctypes.c_uint]
+        func.restype = ctypes.c_int
+        return func
+
+    syscall_number = RENAMEAT2_SYSCALL_NUMBERS.get(platform.machine())
+    syscall = getattr(libc, 'syscall', None)
+    if syscall_number is None or syscall is None:
+        return None
+    syscall.restype = ctypes.c_long
+
+    def renameat2(src_dir_fd, src, dst_dir_fd, dst, flags):
+        return syscall(ctypes.c_long(syscall_number),
+                       ctypes.c_int(src_dir_fd), ctypes.c_char_p(src),
+                       ctypes.c_int(dst_dir_fd), ctypes.c_char_p(dst),
+                       ctypes.c_uint(flags))
+
+    return renameat2
+
+
+_renameat2 = _load_renameat2()
+
+
+def _rename_no_replace(src, dst, dir_fd=None):
+    """
+    Renames a file without overwriting an existing destination.
+
+    os.rename silently replaces the destination on POSIX. On Linux a single
+    renameat2() call with RENAME_NOREPLACE checks and renames atomically.
+    Elsewhere, or if the kernel or filesystem does not support it, the file
+    is hard-linked to its new name (which fails atomically if the name is
+    taken) and the old name is then removed. Where hard links are not
+    available this falls back to an existence check followed by os.rename.
+    On Windows os.rename never overwrites, so it is used directly.
+
+    @param src: Current path (or name relative to dir_fd)
+    @param dst: New path (or name relative to dir_fd)
+    @param dir_fd: Open directory file descriptor, or None for plain paths
+    @return: None
+    @raise FileExistsError: If the destination already exists
+    @raise OSError: If the rename fails for any other reason
+    """
+    if os.name == 'nt':
+        os.rename(src, dst, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        return
+
+    if _renameat2 is not None:
+        fd = AT_FDCWD if dir_fd is None else dir_fd
+        if _renameat2(fd, os.fsencode(src), fd, os.fsencode(dst), RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in RENAMEAT2_UNSUPPORTED_ERRNOS:
+            raise OSError(err, os.strerror(err), src, None, dst)
+
+    if LINK_NOREPLACE_SUPPORTED:
+        try:
+            os.link(src, dst, src_dir_fd=dir_fd, dst_dir_fd=dir_fd, follow_symlinks=False)
+        except OSError as e:
+            if e.errno not in NO_HARD_LINK_ERRNOS:
+                raise
+        else:
+            try:
+                os.unlink(src, dir_fd=dir_fd)
+            except OSError:
+                os.unlink(dst, dir_fd=dir_fd)  # Undo the link, keep the original
+                raise
+            return
+
+    if _path_exists(dst, dir_fd):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+    os.rename(src, dst, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+
+def _rename_directory_group(group):
+    """
+    Renames a batch of files that all live in the same directory.
+
+    Where supported, the directory is opened once and files are renamed by
+    name relative to that handle, so the kernel does not re-resolve the
+    full path for every file.
+
+    @param group: List of file tuples (original_path, new_path, original_name, new_name)
+    @return: List of tuples (file_tuple, status: str, error: OSError or None)
+             status is one of 'RENAMED', 'SKIPPED', 'DENIED' or 'FAILED'
+    """
+    results = []
+
+    dir_fd = None
+    if RENAME_DIR_FD_SUPPORTED:
+        try:
+            dir_fd = os.open(os.path.dirname(group[0][0]), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            dir_fd = None  # Fall back to full paths
+
+    try:
+        for file_info in group:
+            orig_path, new_path, orig_name, new_name = file_info
+            if dir_fd is None:
+                src, dst = orig_path, new_path
+            else:
+                src, dst = orig_name, new_name
+
+            try:
+                _rename_no_replace(src, dst, dir_fd)
+                results.append((file_info, 'RENAMED', None))
+
+            except FileExistsError:
+                results.append((file_info, 'SKIPPED', None))
+
+            except PermissionError as e:
+                results.append((file_info, 'DENIED', e))
+
+            except OSError as e:
+                results.append((file_info, 'FAILED', e))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return results
+
+
+def apply_renames(files_to_rename, directory_path, replacement, prefix, suffix,
+                  quiet=False):
     """
     Applies the file renames and creates a log file.
 
@@ -369,6 +736,7 @@ def apply_renames(files_to_rename, directory_path, replacement, prefix, suffix):
     @param replacement: The replacement character used (for logging)
     @param prefix: The prefix used (for logging)
     @param suffix: The suffix used (for logging)
+    @param quiet: If True, do not print a line per file (the log is still complete)
     @return: Tuple (success_count: int, error_count: int, log_path: str)
     """
     if not files_to_rename:
@@ -377,6 +745,7 @@ def apply_renames(files_to_rename, directory_path, replacement, prefix, suffix):
     success_count = 0
     error_count = 0
     log_entries = []
+    pending = []  # Console lines, written in chunks
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"{LOG_FILENAME_PREFIX}{timestamp}.txt"
@@ -386,49 +755,65 @@ def apply_renames(files_to_rename, directory_path, replacement, prefix, suffix):
     print("APPLYING CHANGES")
     print("=" * 70)
 
-    for orig_path, new_path, orig_name, new_name in files_to_rename:
-        try:
-            # Check if destination already exists
-            if os.path.exists(new_path):
-                error_msg = f"SKIPPED (destination exists): {orig_name}"
-                print(f"  [!] {error_msg}")
-                log_entries.append(f"SKIPPED: {orig_path} -> {new_path} (destination exists)")
-                error_count += 1
-                continue
+    # Files from the same directory are adjacent in the list. Each directory
+    # is renamed serially by one worker (so collisions between files in it
+    # are detected reliably), while different directories run in parallel.
+    groups = [list(group) for _, group in
+              itertools.groupby(files_to_rename, key=lambda f: f[0][:-len(f[2])])]
+    workers = min(RENAME_WORKERS, len(groups))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() returns results in submission order, keeping output stable
+        for results in executor.map(_rename_directory_group, groups):
+            for (orig_path, new_path, orig_name, new_name), status, error in results:
+                if status == 'RENAMED':
+                    line = f"  [OK] {orig_name} -> {new_name}"
+                    log_entries.append(f"RENAMED: {orig_path} -> {new_path}")
+                    success_count += 1
+                elif status == 'SKIPPED':
+                    error_msg = f"SKIPPED (destination exists): {orig_name}"
+                    line = f"  [!] {error_msg}"
+                    log_entries.append(f"SKIPPED: {orig_path} -> {new_path} (destination exists)")
+                    error_count += 1
+                elif status == 'DENIED':
+                    error_msg = f"FAILED (permission denied): {orig_name}"
+                    line = f"  [X] {error_msg}"
+                    log_entries.append(f"FAILED: {orig_path} -> Permission denied")
+                    error_count += 1
+                else:
+                    error_msg = f"FAILED ({str(error)}): {orig_name}"
+                    line = f"  [X] {error_msg}"
+                    log_entries.append(f"FAILED: {orig_path} -> {str(error)}")
+                    error_count += 1
 
-            # Perform the rename
-            os.rename(orig_path, new_path)
-            print(f"  [OK] {orig_name} -> {new_name}")
-            log_entries.append(f"RENAMED: {orig_path} -> {new_path}")
-            success_count += 1
+                if not quiet:
+                    pending.append(line)
+                    if len(pending) >= OUTPUT_CHUNK_SIZE:
+                        _write_lines(pending)
 
-        except PermissionError:
-            error_msg = f"FAILED (permission denied): {orig_name}"
-            print(f"  [X] {error_msg}")
-            log_entries.append(f"FAILED: {orig_path} -> Permission denied")
-            error_count += 1
-
-        except OSError as e:
-            error_msg = f"FAILED ({str(e)}): {orig_name}"
-            print(f"  [X] {error_msg}")
-            log_entries.append(f"FAILED: {orig_path} -> {str(e)}")
-            error_count += 1
+    _write_lines(pending)
 
     # Write log file
     try:
         replace_display = f"'{replacement}'" if replacement else "(removed)"
+        log_lines = [
+            f"Rename Operation Log - {timestamp}",
+            f"Directory: {directory_path}",
+            f"Replacement: {replace_display}",
+        ]
+        if prefix:
+            log_lines.append(f"Prefix: '{prefix}'")
+        if suffix:
+            log_lines.append(f"Suffix: '{suffix}'")
+        log_lines.append("=" * 70)
+        log_lines.append("")
+        log_lines.extend(log_entries)
+        log_lines.append("")
+        log_lines.append(f"Summary: {success_count} successful, {error_count} errors")
+
+        # Write the whole log in one call rather than one write per line
         with open(log_path, 'w') as log_file:
-            log_file.write(f"Rename Operation Log - {timestamp}\n")
-            log_file.write(f"Directory: {directory_path}\n")
-            log_file.write(f"Replacement: {replace_display}\n")
-            if prefix:
-                log_file.write(f"Prefix: '{prefix}'\n")
-            if suffix:
-                log_file.write(f"Suffix: '{suffix}'\n")
-            log_file.write("=" * 70 + "\n\n")
-            for entry in log_entries:
-                log_file.write(entry + "\n")
-            log_file.write(f"\nSummary: {success_count} successful, {error_count} errors\n")
+            log_file.write("\n".join(log_lines) + "\n")
     except IOError:
         print(f"\nWarning: Could not write log file to {log_path}")
         log_path = None
@@ -512,6 +897,13 @@ Examples:
         help="Text to add at the end of each filename (after base name, before extension)"
     )
 
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only show summaries, not every file (the log file still lists every rename)"
+    )
+
     return parser.parse_args()
 
 
@@ -576,7 +968,8 @@ def main():
     )
 
     # Display preview
-    display_preview(files_to_rename, stats, args.replace, args.prefix, args.suffix)
+    display_preview(files_to_rename, stats, args.replace, args.prefix, args.suffix,
+                    quiet=args.quiet)
 
     # If not applying, show instructions and exit
     if not args.apply:
@@ -591,6 +984,8 @@ def main():
                 cmd_parts.append(f'--suffix="{args.suffix}"')
             if args.recursive:
                 cmd_parts.append("--recursive")
+            if args.quiet:
+                cmd_parts.append("--quiet")
             cmd_parts.append("--apply")
             print(f"  {' '.join(cmd_parts)}")
         return 0
@@ -610,7 +1005,8 @@ def main():
             directory_path,
             args.replace,
             args.prefix,
-            args.suffix
+            args.suffix,
+            quiet=args.quiet
         )
 
         # Display summary